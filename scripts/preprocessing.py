@@ -1,13 +1,71 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+
+# Explicit column types so the Arrow reader skips type inference.
+# Dates are read as text and parsed by pandas (see _parse_dates), so
+# timestamps with and without a UTC offset are both accepted. Volume is left to inference
+# (int64, or double if fractional) since float32 cannot hold large volumes exactly.
+NEWS_SCHEMA = pa.schema([
+    ('date', pa.string()),
+    ('headline', pa.string()),
+    ('publisher', pa.string()),
+])
+STOCK_SCHEMA = pa.schema([
+    ('date', pa.string()),
+    ('open', pa.float32()),
+    ('high', pa.float32()),
+    ('low', pa.float32()),
+    ('close', pa.float32()),
+])
+
+# Prices are quoted in exchange time, so news timestamps are aligned in the same zone
+EXCHANGE_TZ = 'America/New_York'
+_OFFSET_RE = r'(?:Z|[+-]\d{2}:?\d{2})$'
+
+def _parse_dates(dates):
+    """
+    Parse ISO-8601 strings into tz-aware EXCHANGE_TZ datetime64[ns].
+    Values with a UTC offset are converted to EXCHANGE_TZ; values without
+    one are taken to be exchange-local already.
+    """
+    has_offset = dates.str.contains(_OFFSET_RE, na=False)
+    parsed = pd.Series(pd.NaT, index=dates.index, dtype=f'datetime64[ns, {EXCHANGE_TZ}]')
+    if (~has_offset).any():
+        naive = pd.to_datetime(dates[~has_offset], format='ISO8601')
+        # Wall-clock times in the repeated/skipped DST hour resolve to standard time
+        parsed[~has_offset] = naive.dt.tz_localize(EXCHANGE_TZ, ambiguous=False, nonexistent='shift_forward')
+    if has_offset.any():
+        aware = pd.to_datetime(dates[has_offset], format='ISO8601', utc=True)
+        parsed[has_offset] = aware.dt.tz_convert(EXCHANGE_TZ)
+    return parsed
+
+def _read_csv(path, schema):
+    convert_options = pv.ConvertOptions(column_types=schema)
+    df = pv.read_csv(path, convert_options=convert_options).to_pandas()
+    df['date'] = _parse_dates(df['date'])
+    return df
 
 def load_data(news_path, stock_path):
-    news_df = pd.read_csv(news_path, parse_dates=['date'])
-    stock_df = pd.read_csv(stock_path, parse_dates=['date'])
+    news_df = _read_csv(news_path, NEWS_SCHEMA)
+    stock_df = _read_csv(stock_path, STOCK_SCHEMA)
     return news_df, stock_df
 
+def _to_day(dates):
+    # Midnight-floored, tz-naive datetime64[ns] in exchange time rather than Python date objects
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_convert(EXCHANGE_TZ).dt.tz_localize(None)
+    return dates.dt.floor('D').astype('datetime64[ns]')
+
 def align_dates(news_df, stock_df):
-    news_df['date'] = news_df['date'].dt.date
-    stock_df['date'] = stock_df['date'].dt.date
+    """
+    Truncate both 'date' columns to the exchange-local day as datetime64[ns]
+    (not Python date objects) and sort news by date for fast downstream
+    groupby/merge. Both frames are modified in place and returned.
+    """
+    news_df['date'] = _to_day(news_df['date'])
+    stock_df['date'] = _to_day(stock_df['date'])
+    news_df.sort_values('date', kind='stable', inplace=True)
     return news_df, stock_df
 
 def save_data(df, path):
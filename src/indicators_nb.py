@@ -0,0 +1,112 @@
+# module for Numba-compiled technical indicators
+
+import numpy as np
+from numba import njit
+
+# fastmath without the no-NaN/no-inf flags: NaN marks the warm-up period
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def sma_nb(close, w, out):
+    """
+    Simple moving average over window w; the first w-1 values are NaN.
+    """
+    n = close.shape[0]
+    total = 0.0
+    for i in range(n):
+        total += close[i]
+        if i >= w:
+            total -= close[i - w]
+        out[i] = total / w if i >= w - 1 else np.nan
+
+
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def ema_nb(values, start, span, out):
+    """
+    EMA of values[start:], seeded with the SMA of its first span values.
+    Entries before start + span - 1 are NaN.
+    """
+    n = values.shape[0]
+    alpha = 2.0 / (span + 1)
+    out[:] = np.nan
+    seed_end = start + span - 1
+    if seed_end >= n:
+        return
+    total = 0.0
+    for i in range(start, seed_end + 1):
+        total += values[i]
+    ema = total / span
+    out[seed_end] = ema
+    for i in range(seed_end + 1, n):
+        ema = alpha * values[i] + (1.0 - alpha) * ema
+        out[i] = ema
+
+
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def rsi_wilder_nb(close, w, out):
+    """
+    RSI with Wilder's smoothing, avg = (prev * (w - 1) + cur) / w.
+    The first w values are NaN.
+    """
+    n = close.shape[0]
+    out[:] = np.nan
+    if n <= w:
+        return
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, w + 1):
+        change = close[i] - close[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= w
+    avg_loss /= w
+    for i in range(w, n):
+        if i > w:
+            change = close[i] - close[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            avg_gain = (avg_gain * (w - 1) + gain) / w
+            avg_loss = (avg_loss * (w - 1) + loss) / w
+        total = avg_gain + avg_loss
+        out[i] = 100.0 * avg_gain / total if total != 0 else 0.0
+
+
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def macd_nb(close, fast, slow, signal, out_macd, out_sig, out_hist):
+    """
+    MACD line, signal line and histogram. Like TA-Lib, all three are NaN
+    until the signal line is defined (slow + signal - 2 bars).
+    """
+    n = close.shape[0]
+    fast_ema = np.empty(n)
+    slow_ema = np.empty(n)
+    # Start the fast EMA so it lines up with the first slow EMA value
+    ema_nb(close, slow - fast, fast, fast_ema)
+    ema_nb(close, 0, slow, slow_ema)
+    for i in range(n):
+        out_macd[i] = fast_ema[i] - slow_ema[i]
+    ema_nb(out_macd, slow - 1, signal, out_sig)
+    for i in range(n):
+        if np.isnan(out_sig[i]):
+            out_macd[i] = np.nan
+            out_hist[i] = np.nan
+        else:
+            out_hist[i] = out_macd[i] - out_sig[i]
+
+
+def compute_all(close):
+    """
+    Compute MA_20, MA_50, RSI_14, MACD, MACD signal and MACD histogram
+    into a single (N, 6) float64 array.
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    # Column-major buffer so each indicator writes a contiguous column
+    out = np.empty((close.shape[0], 6), order='F')
+    sma_nb(close, 20, out[:, 0])
+    sma_nb(close, 50, out[:, 1])
+    rsi_wilder_nb(close, 14, out[:, 2])
+    macd_nb(close, 12, 26, 9, out[:, 3], out[:, 4], out[:, 5])
+    return out
@@ -1,42 +1,65 @@
 # src/stock_analysis.py
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import talib
-import mplfinance as mpf
+from joblib import Parallel, delayed
+
+from src.indicators_nb import compute_all
+
+INDICATOR_COLUMNS = ['MA_20', 'MA_50', 'RSI', 'MACD', 'MACD_signal', 'MACD_hist']
+# Volume stays as loaded: float32 cannot represent volumes above 2**24 exactly
+PRICE_COLUMNS = ['open', 'high', 'low', 'close']
 
 class StockAnalysis:
-    def __init__(self, ticker, df = None, file_path = None):
+    def __init__(self, ticker, df = None, file_path = None, copy: bool = False):
         """
         Initialize the StockAnalysis object.
+
+        The provided df is never modified: sorting already builds a new frame,
+        so it is only copied up front when copy=True.
         """
         self.ticker = ticker
+        self._df_indexed = None
 
         if df is not None:
             # Use the provided DataFrame directly
-            self.df = df.copy()
+            self.df = df.copy() if copy else df
         elif file_path is not None:
             # Load data from file
             self.df = pd.read_csv(file_path, parse_dates=['Date'])
         else:
             raise ValueError("Must provide either a file_path or a DataFrame.")
-        self.df.columns = self.df.columns.str.lower()
-        self.df['ticker'] = ticker
+        # Shallow rename so the caller's column labels are left untouched
+        self.df = self.df.rename(columns=str.lower, copy=False)
         # Sort by date
-        self.df.sort_values('date', inplace=True)
-        self.df.reset_index(drop=True, inplace=True)
+        self.df = self.df.sort_values('date', kind='stable', ignore_index=True)
+        self.df['ticker'] = ticker
+        # float32 is ample for price precision and halves memory traffic in rolling indicators
+        price_columns = self.df.columns.intersection(PRICE_COLUMNS)
+        self.df[price_columns] = self.df[price_columns].astype(np.float32)
 
         print(f"Data for {ticker} loaded and sorted by date successfully.")
 
+    @property
+    def df_indexed(self):
+        """
+        Date-indexed view of the data for plotting, cached until columns are added.
+        """
+        if self._df_indexed is None or len(self._df_indexed) != len(self.df):
+            self._df_indexed = self.df.set_index('date', drop=False)
+        return self._df_indexed
+
     def plot_ohlc_prices(self):
         """
         Plot open, high, low, and close prices as line plots.
         """
+        import matplotlib.pyplot as plt
+        df = self.df_indexed
         plt.figure(figsize=(12,6))
-        plt.plot(self.df['date'], self.df['open'], label='Open', alpha=0.6)
-        plt.plot(self.df['date'], self.df['high'], label='High', alpha=0.6)
-        plt.plot(self.df['date'], self.df['low'], label='Low', alpha=0.6)
-        plt.plot(self.df['date'], self.df['close'], label='Close', alpha=0.8, linewidth=2)
+        plt.plot(df.index, df['open'], label='Open', alpha=0.6)
+        plt.plot(df.index, df['high'], label='High', alpha=0.6)
+        plt.plot(df.index, df['low'], label='Low', alpha=0.6)
+        plt.plot(df.index, df['close'], label='Close', alpha=0.8, linewidth=2)
         plt.title(f'{self.ticker} OHLC Prices')
         plt.xlabel('Date')
         plt.ylabel('Price')
@@ -48,8 +71,7 @@ class StockAnalysis:
         Plot candlestick chart using mplfinance.
         """
         import mplfinance as mpf
-        df_candle = self.df.set_index('date')
-        mpf.plot(df_candle,
+        mpf.plot(self.df_indexed,
                 type='candle',
                 volume=True,
                 title=f'{self.ticker} Candlestick Chart',
@@ -61,17 +83,20 @@ class StockAnalysis:
         """
         Add key technical indicators: Moving Averages, RSI, MACD.
         """
-        self.df['MA_20'] = talib.SMA(self.df['close'], timeperiod=20)
-        self.df['MA_50'] = talib.SMA(self.df['close'], timeperiod=50)
-        self.df['RSI'] = talib.RSI(self.df['close'], timeperiod=14)
-        self.df['MACD'], self.df['MACD_signal'], self.df['MACD_hist'] = talib.MACD(self.df['close'])
+        # Kernels run in float64; results are stored back as float32
+        self.df[INDICATOR_COLUMNS] = compute_all(self.df['close'].to_numpy()).astype(np.float32)
+        self._df_indexed = None
         print(f"Technical indicators added for {self.ticker}.")
 
     def compute_daily_returns(self):
         """
         Compute daily returns.
         """
-        self.df['daily_return'] = self.df['close'].pct_change()
+        close = self.df['close'].to_numpy(dtype=np.float64)
+        daily_return = np.full(len(close), np.nan)
+        daily_return[1:] = close[1:] / close[:-1] - 1
+        self.df['daily_return'] = daily_return
+        self._df_indexed = None
         print(f"Daily returns computed for {self.ticker}.")
 
     def adjust_for_splits(self):
@@ -79,20 +104,26 @@ class StockAnalysis:
         Adjust closing price for stock splits.
         """
         if 'stock splits' in self.df.columns:
-            self.df['adjusted_close'] = self.df['close'] / (self.df['stock splits'].replace(0, 1))
+            close = self.df['close'].to_numpy()
+            splits = self.df['stock splits'].to_numpy()
+            # Rows without a split (ratio 0) keep their close price
+            self.df['adjusted_close'] = close / np.where(splits == 0, 1.0, splits)
             print(f"Adjusted for stock splits for {self.ticker}.")
         else:
             self.df['adjusted_close'] = self.df['close']
             print("No stock splits data found.")
+        self._df_indexed = None
 
     def plot_price_and_ma(self):
         """
         Plot closing price and moving averages.
         """
+        import matplotlib.pyplot as plt
+        df = self.df_indexed
         plt.figure(figsize=(12,6))
-        plt.plot(self.df['date'], self.df['close'], label='Close Price', alpha=0.6)
-        plt.plot(self.df['date'], self.df['MA_20'], label='20-day MA', color='red')
-        plt.plot(self.df['date'], self.df['MA_50'], label='50-day MA', color='green')
+        plt.plot(df.index, df['close'], label='Close Price', alpha=0.6)
+        plt.plot(df.index, df['MA_20'], label='20-day MA', color='red')
+        plt.plot(df.index, df['MA_50'], label='50-day MA', color='green')
         plt.title(f'{self.ticker} Price with Moving Averages')
         plt.xlabel('Date')
         plt.ylabel('Price')
@@ -103,8 +134,10 @@ class StockAnalysis:
         """
         Plot trading volume over time.
         """
+        import matplotlib.pyplot as plt
+        df = self.df_indexed
         plt.figure(figsize=(12,4))
-        plt.bar(self.df['date'], self.df['volume'], color='skyblue')
+        plt.bar(df.index, df['volume'], color='skyblue')
         plt.title(f'{self.ticker} Trading Volume')
         plt.xlabel('Date')
         plt.ylabel('Volume')
@@ -114,9 +147,11 @@ class StockAnalysis:
         """
         Plot MACD indicator.
         """
+        import matplotlib.pyplot as plt
+        df = self.df_indexed
         plt.figure(figsize=(12,4))
-        plt.plot(self.df['date'], self.df['MACD'], label='MACD', color='blue')
-        plt.plot(self.df['date'], self.df['MACD_signal'], label='Signal Line', color='orange')
+        plt.plot(df.index, df['MACD'], label='MACD', color='blue')
+        plt.plot(df.index, df['MACD_signal'], label='Signal Line', color='orange')
         plt.title(f'{self.ticker} MACD')
         plt.xlabel('Date')
         plt.ylabel('MACD')
@@ -127,8 +162,10 @@ class StockAnalysis:
         """
         Plot RSI indicator.
         """
+        import matplotlib.pyplot as plt
+        df = self.df_indexed
         plt.figure(figsize=(12,4))
-        plt.plot(self.df['date'], self.df['RSI'], color='purple')
+        plt.plot(df.index, df['RSI'], color='purple')
         plt.axhline(70, color='red', linestyle='--', label='Overbought (70)')
         plt.axhline(30, color='green', linestyle='--', label='Oversold (30)')
         plt.title(f'{self.ticker} RSI')
@@ -151,6 +188,7 @@ class StockAnalysis:
         # Calculate momentum (rate of change)
         momentum = indicators.momentum(self.df['close'], window=10)
         self.df['momentum'] = momentum
+        self._df_indexed = None
 
         print(f"PyNance metrics (volatility, momentum) added for {self.ticker}.")
 
@@ -158,9 +196,11 @@ class StockAnalysis:
         """
         Plot the volatility metric over time.
         """
+        import matplotlib.pyplot as plt
         if 'volatility' in self.df.columns:
+            df = self.df_indexed
             plt.figure(figsize=(12,4))
-            plt.plot(self.df['date'], self.df['volatility'], color='teal')
+            plt.plot(df.index, df['volatility'], color='teal')
             plt.title(f'{self.ticker} Volatility Over Time')
             plt.xlabel('Date')
             plt.ylabel('Volatility')
@@ -172,9 +212,11 @@ class StockAnalysis:
         """
         Plot the momentum metric over time.
         """
+        import matplotlib.pyplot as plt
         if 'momentum' in self.df.columns:
+            df = self.df_indexed
             plt.figure(figsize=(12,4))
-            plt.plot(self.df['date'], self.df['momentum'], color='orange')
+            plt.plot(df.index, df['momentum'], color='orange')
             plt.title(f'{self.ticker} Momentum Over Time')
             plt.xlabel('Date')
             plt.ylabel('Momentum')
@@ -187,9 +229,11 @@ class StockAnalysis:
         """
         Plot dividend payouts over time if available.
         """
+        import matplotlib.pyplot as plt
         if 'dividend' in self.df.columns and self.df['dividend'].sum() > 0:
+            df = self.df_indexed
             plt.figure(figsize=(12,4))
-            plt.bar(self.df['date'], self.df['dividend'], color='gold')
+            plt.bar(df.index, df['dividend'], color='gold')
             plt.title(f'{self.ticker} Dividend Payouts')
             plt.xlabel('Date')
             plt.ylabel('Dividend')
@@ -202,5 +246,28 @@ class StockAnalysis:
         Return the DataFrame.
         """
         return self.df
-    
 
+
+def compute_indicators(df, ticker):
+    """
+    Run the non-plotting StockAnalysis steps for one ticker and return its DataFrame.
+    """
+    analysis = StockAnalysis(ticker, df=df)
+    analysis.add_technical_indicators()
+    analysis.compute_daily_returns()
+    analysis.adjust_for_splits()
+    return analysis.get_data()
+
+
+def analyze_tickers(ticker_dfs, n_jobs=-1):
+    """
+    Compute indicators for several tickers in parallel worker processes.
+
+    ticker_dfs maps ticker -> price DataFrame. Returns one DataFrame with all
+    tickers concatenated. Scripts calling this on Windows must do so under
+    `if __name__ == '__main__':`.
+    """
+    results = Parallel(n_jobs=n_jobs, backend='loky', batch_size='auto')(
+        delayed(compute_indicators)(df, ticker) for ticker, df in ticker_dfs.items()
+    )
+    return pd.concat(results, ignore_index=True)
@@ -1,38 +1,271 @@
 # module for sentiment analysis
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from textblob import TextBlob
+from textblob.en import sentiment as _TEXTBLOB_LEXICON
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
 
+# TextBlob's tokenizer splits these marks off word edges and quotes off everywhere
+_PUNCTUATION = re.escape(".,;:!?()[]{}`'\"@#$^&*+-|=~_")
+_TOKEN_RE = re.compile(rf"[^\s{_PUNCTUATION}](?:\S*[^\s{_PUNCTUATION}])?|\.\.\.|[{_PUNCTUATION}]")
+_QUOTE_RE = re.compile(r"['\"\u201c\u201d\u2018\u2019]")
+_NEGATIONS = ("no", "not", "n't", "never")
+# Below this many distinct headlines, process start-up costs more than it saves
+_PARALLEL_MIN_TEXTS = 100_000
+# Headline lengths subsampled for the KDE curve, capping its cost regardless of N
+_KDE_MAX_SAMPLES = 50_000
+
+
+class _LetterTable(dict):
+    """
+    str.translate table: ASCII letters -> lowercase, everything else -> space.
+    """
+    def __missing__(self, codepoint):
+        return ' '
+
+
+_CLEAN_TABLE = _LetterTable(
+    (c, chr(c).lower() if chr(c).isascii() and chr(c).isalpha() else ' ') for c in range(256)
+)
+
+
+def _load_lexicon():
+    """
+    Load TextBlob's sentiment lexicon once into a token -> id dict plus
+    per-word polarity, intensity, adverb (modifier) and "-ly" flags.
+    """
+    words = list(_TEXTBLOB_LEXICON.items())
+    token_to_id = {word: i for i, (word, _) in enumerate(words)}
+    polarity = np.array([senses[None][0] for _, senses in words], dtype=np.float64)
+    intensity = np.array([senses[None][2] for _, senses in words], dtype=np.float64)
+    modifier = np.array(['RB' in senses for _, senses in words])
+    ends_ly = np.array([word.endswith('ly') for word, _ in words])
+    return token_to_id, polarity, intensity, modifier, ends_ly
+
+
+_TOKEN_TO_ID, _POLARITY, _INTENSITY, _MODIFIER, _ENDS_LY = _load_lexicon()
+_VADER = SentimentIntensityAnalyzer()
+
+
+@lru_cache(maxsize=200_000)
+def get_sentiment(text):
+    """
+    Score a single headline with the VADER compound score.
+    Memoized across calls: apply_sentiment(method='vader') scores each distinct
+    headline through here, so repeated runs over overlapping news reuse scores.
+    The default lexicon path does not use this cache.
+    """
+    if pd.isna(text):
+        return 0.0  # neutral for empty headlines
+    return _VADER.polarity_scores(text)['compound']
+
+
+def _score_vader(texts):
+    """
+    Score many headlines with get_sentiment (VADER compound).
+    """
+    return np.array([get_sentiment(text) for text in texts], dtype=np.float64)
+
+
+def _last_before(mask, positions, row_start):
+    """
+    Position of the last True in mask strictly before each token of the same
+    headline, or -1 when there is none.
+    """
+    last = np.maximum.accumulate(np.where(mask, positions, -1))
+    last = np.concatenate(([-1], last[:-1]))
+    return np.where(last >= row_start, last, -1)
+
+
+def score_headlines(texts):
+    """
+    Score many headlines in one vectorized pass, reproducing TextBlob's
+    polarity rules without building a TextBlob per headline.
+
+    As in TextBlob, an adverb followed by a scored word is folded into it
+    ("very good" scores good * intensity(very)), a negation flips the
+    following assessment to -0.5x and inverts a modifier's intensity
+    ("not very good"), and "!" boosts the preceding assessment by 1.25.
+    Each headline gets the mean of its assessments, or 0 when there are none.
+    Emoticons, "(!)" sarcasm marks and abbreviation periods are not special-cased.
+    """
+    texts = pd.Series(texts, dtype=object).reset_index(drop=True)
+    if texts.empty:
+        return np.zeros(0)
+    tokens = (texts.fillna('')
+              .str.replace("n't", " n't", regex=False)
+              .str.replace(_QUOTE_RE, r" \g<0> ", regex=True)
+              .str.lower()
+              .str.findall(_TOKEN_RE)
+              .explode()
+              .fillna(''))
+
+    rows = tokens.index.to_numpy()
+    positions = np.arange(len(rows))
+    new_row = np.concatenate(([True], rows[1:] != rows[:-1]))
+    row_start = np.maximum.accumulate(np.where(new_row, positions, 0))
+
+    ids = tokens.map(_TOKEN_TO_ID).fillna(-1).to_numpy(dtype=np.intp)
+    known = ids >= 0
+    if not known.any():
+        return np.zeros(len(texts))
+    unknown = ~known
+    is_neg = tokens.isin(_NEGATIONS).to_numpy()
+    lengths = tokens.str.len().to_numpy()
+    stripped_lengths = tokens.str.strip("'").str.len().to_numpy()
+
+    # Modifier state: the previous scored word is an adverb and no long unknown word intervened
+    prev_known = _last_before(known, positions, row_start)
+    has_prev = prev_known >= 0
+    prev_ids = ids[np.where(has_prev, prev_known, 0)]
+    prev_is_modifier = has_prev & _MODIFIER[prev_ids]
+    prev_ends_ly = has_prev & _ENDS_LY[prev_ids]
+    # A negation after an "-ly" adverb attaches to it instead of resetting it ("really not good")
+    modifier_reset = unknown & (lengths > 2) & ~(is_neg & prev_ends_ly)
+    modifier_active = prev_is_modifier & (_last_before(modifier_reset, positions, row_start) < prev_known)
+    negates_modifier = unknown & is_neg & modifier_active & prev_ends_ly
+
+    # Negation state: set by a negation, cleared by scored words and unknown words longer than one letter
+    negation_set = is_neg & ~negates_modifier
+    negation_clear = (known & ~is_neg) | (unknown & ~is_neg & (stripped_lengths > 1)) | negates_modifier
+    negated = known & (_last_before(negation_set, positions, row_start)
+                       > _last_before(negation_clear, positions, row_start))
+
+    # Each scored word either starts a new assessment or is folded into the modifier's one
+    starts = known & ~modifier_active
+    assessment = np.cumsum(starts) - 1
+    n_assessments = int(starts.sum())
+    known_positions = positions[known]
+    is_last = np.zeros(len(rows), dtype=bool)
+    is_last[known_positions[np.concatenate((assessment[known][1:] != assessment[known][:-1], [True]))]] = True
+    last_positions = positions[is_last]
+
+    # Polarity of the last word, scaled by the (possibly inverted) intensity of its modifier
+    effective_intensity = np.where(negated, 1.0 / _INTENSITY[ids], _INTENSITY[ids])
+    polarity = _POLARITY[ids[last_positions]]
+    folded = ~starts[last_positions]
+    modifier_positions = prev_known[last_positions[folded]]
+    polarity[folded] = np.clip(polarity[folded] * effective_intensity[modifier_positions], -1.0, 1.0)
+
+    bangs = unknown & (tokens.to_numpy() == '!') & has_prev
+    bangs &= is_last[np.where(has_prev, prev_known, 0)]
+    boosts = np.bincount(assessment[prev_known[bangs]], minlength=n_assessments)
+    polarity = np.clip(polarity * 1.25 ** boosts, -1.0, 1.0)
+
+    is_negated = np.bincount(assessment[known], weights=negated[known], minlength=n_assessments) > 0
+    is_negated[assessment[prev_known[negates_modifier]]] = True
+    scores = np.where(is_negated, polarity * -0.5, polarity)
+
+    assessment_rows = rows[positions[starts]]
+    totals = np.bincount(assessment_rows, weights=scores, minlength=len(texts))
+    counts = np.bincount(assessment_rows, minlength=len(texts))
+    return np.divide(totals, counts, out=np.zeros(len(texts)), where=counts > 0)
+
+
+_SCORERS = {'lexicon': score_headlines, 'vader': _score_vader}
+
+
+def _score_parallel(scorer, texts, max_workers=None):
+    """
+    Split texts into ~8 chunks per worker and score them in worker processes.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = -(-len(texts) // (workers * 8))
+    chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return np.concatenate(list(executor.map(scorer, chunks)))
+
+
+def apply_sentiment(df, text_column='headline', method='lexicon', max_workers=None):
+    """
+    Add a float32 'sentiment' column scoring df[text_column], either with the
+    vectorized TextBlob lexicon ('lexicon') or VADER compound scores ('vader').
+    Each distinct text is scored once (in worker processes for large inputs);
+    missing text scores 0.
+    """
+    if method not in _SCORERS:
+        raise ValueError(f"Unknown sentiment method: {method!r}. Use 'lexicon' or 'vader'.")
+    scorer = _SCORERS[method]
+
+    codes, uniques = pd.factorize(df[text_column])
+    if len(uniques) >= _PARALLEL_MIN_TEXTS:
+        unique_scores = _score_parallel(scorer, uniques, max_workers)
+    else:
+        unique_scores = scorer(uniques)
+    # Trailing 0.0 is what code -1 (missing text) picks up
+    scores = np.append(unique_scores, 0.0).astype(np.float32)
+    df['sentiment'] = scores[codes]
+    return df
+
+
 class FinancialNewsEDA:
     def __init__(self, news_data: pd.DataFrame):
         """
         Initialize the EDA object with the dataset.
         """
         self.news_data = news_data.copy()
+        # Categorical publishers let counts and groupbys run on integer codes
+        if 'publisher' in self.news_data.columns:
+            self.news_data['publisher'] = self.news_data['publisher'].astype('category')
+        self._vectorizer = None
+        self._dtm = None
+        self._lda = None
+        self._time_agg = None
 
     def convert_dates(self):
         """
         Convert the 'date' column to datetime with timezone awareness.
         """
         self.news_data['date'] = pd.to_datetime(self.news_data['date'], errors='coerce', utc=True)
-        self.news_data['date_only'] = self.news_data['date'].dt.date
+        # Midnight-floored datetime64 rather than Python date objects, so groupbys hash natively
+        self.news_data['date_only'] = self.news_data['date'].dt.floor('D')
+        self._time_agg = None
         print("Date conversion completed. Here are a few examples:")
         print(self.news_data[['date', 'date_only']].head())
 
+    def _publication_counts(self):
+        """
+        Article counts per (date_only, hour), computed in one pass and cached.
+        """
+        if self._time_agg is None:
+            self.news_data['hour'] = self.news_data['date'].dt.hour
+            self._time_agg = (self.news_data
+                              .groupby(['date_only', 'hour'], sort=True, observed=True)
+                              .size()
+                              .rename('n'))
+        return self._time_agg
+
     def headline_length_stats(self):
         """
         Calculate basic statistics of headline lengths and plot distribution.
         """
-        self.news_data['headline_length'] = self.news_data['headline'].apply(len)
+        import matplotlib.pyplot as plt
+        from scipy.stats import gaussian_kde
+        # Nullable ints so missing headlines stay missing instead of counting as length 0
+        self.news_data['headline_length'] = self.news_data['headline'].str.len().astype('Int32')
         print("Headline Length Stats:")
         print(self.news_data['headline_length'].describe())
 
+        lengths = self.news_data['headline_length'].dropna().to_numpy(dtype=np.int32)
+        counts, edges = np.histogram(lengths, bins=30)
+        widths = np.diff(edges)
+
         plt.figure(figsize=(8,5))
-        sns.histplot(self.news_data['headline_length'], bins=30, kde=True, color='skyblue')
+        plt.bar(edges[:-1], counts, width=widths, align='edge', color='skyblue', edgecolor='white')
+        if len(lengths) > 0 and lengths.min() != lengths.max():
+            sample = lengths
+            if len(lengths) > _KDE_MAX_SAMPLES:
+                sample = np.random.default_rng(0).choice(lengths, _KDE_MAX_SAMPLES, replace=False)
+            xs = np.linspace(edges[0], edges[-1], 200)
+            # Scale the density to histogram counts
+            plt.plot(xs, gaussian_kde(sample)(xs) * len(lengths) * widths[0], color='skyblue')
         plt.title('Distribution of Headline Lengths')
         plt.xlabel('Number of Characters')
         plt.ylabel('Frequency')
@@ -42,12 +275,14 @@ class FinancialNewsEDA:
         """
         Count articles per publisher and plot top N.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         publisher_counts = self.news_data['publisher'].value_counts()
         print("\nTop Publishers:")
         print(publisher_counts.head(top_n))
 
         plt.figure(figsize=(10,6))
-        sns.barplot(x=publisher_counts.head(top_n).index, y=publisher_counts.head(top_n).values, palette='viridis')
+        sns.barplot(x=publisher_counts.head(top_n).index.astype(str), y=publisher_counts.head(top_n).values, palette='viridis')
         plt.xticks(rotation=45)
         plt.title('Top Publishers by Article Count')
         plt.ylabel('Number of Articles')
@@ -57,7 +292,8 @@ class FinancialNewsEDA:
         """
         Plot article publication frequency over time.
         """
-        articles_per_day = self.news_data.groupby('date_only').size()
+        import matplotlib.pyplot as plt
+        articles_per_day = self._publication_counts().groupby(level=0).sum()
 
         plt.figure(figsize=(12,6))
         articles_per_day.plot()
@@ -71,8 +307,16 @@ class FinancialNewsEDA:
         """
         Identify unique email domains and visualize top N.
         """
-        self.news_data['publisher_domain'] = self.news_data['publisher'].apply(
-            lambda x: x.split('@')[-1] if isinstance(x, str) and '@' in x else 'No Email'
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        # Derive the domain once per distinct publisher, then map rows via category codes
+        publisher = self.news_data['publisher']
+        publishers = publisher.cat.categories.astype(str)
+        domains = publishers.str.rsplit('@', n=1).str[-1].where(publishers.str.contains('@'), 'No Email')
+        # Trailing 'No Email' entry is what code -1 (missing publisher) picks up
+        domain_codes, domain_names = pd.factorize(domains.append(pd.Index(['No Email'])))
+        self.news_data['publisher_domain'] = pd.Categorical.from_codes(
+            domain_codes[publisher.cat.codes.to_numpy()], categories=domain_names
         )
         domain_counts = self.news_data['publisher_domain'].value_counts()
 
@@ -80,7 +324,7 @@ class FinancialNewsEDA:
         print(domain_counts.head(top_n))
 
         plt.figure(figsize=(10,6))
-        sns.barplot(x=domain_counts.head(top_n).index, y=domain_counts.head(top_n).values, palette='magma')
+        sns.barplot(x=domain_counts.head(top_n).index.astype(str), y=domain_counts.head(top_n).values, palette='magma')
         plt.title('Top 10 Publisher Email Domains')
         plt.ylabel('Number of Articles')
         plt.xlabel('Email Domain')
@@ -91,8 +335,8 @@ class FinancialNewsEDA:
         """
         Plot the number of articles by hour of publication.
         """
-        self.news_data['hour'] = self.news_data['date'].dt.hour
-        hourly_counts = self.news_data.groupby('hour').size()
+        import matplotlib.pyplot as plt
+        hourly_counts = self._publication_counts().groupby(level=1).sum()
 
         plt.figure(figsize=(10,6))
         hourly_counts.plot(kind='bar', color='teal')
@@ -105,7 +349,8 @@ class FinancialNewsEDA:
         """
         Plot rolling average of article publication frequency.
         """
-        articles_per_day = self.news_data.groupby('date_only').size()
+        import matplotlib.pyplot as plt
+        articles_per_day = self._publication_counts().groupby(level=0).sum()
         rolling_articles = articles_per_day.rolling(window=window).mean()
 
         plt.figure(figsize=(12,6))
@@ -121,20 +366,28 @@ class FinancialNewsEDA:
         """
         Basic text cleaning and preprocessing for topic modeling.
         """
-        self.news_data['clean_headline'] = self.news_data['headline'].str.lower().str.replace(r'[^a-zA-Z]', ' ', regex=True)
+        self.news_data['clean_headline'] = self.news_data['headline'].fillna('').str.translate(_CLEAN_TABLE)
+        # Cleaned text changed, so any fitted topic model is stale
+        self._vectorizer = self._dtm = self._lda = None
         return self.news_data
 
     def perform_lda(self, n_topics=5, n_top_words=10):
         """
         Perform LDA topic modeling and display top words per topic.
+        The fitted vectorizer and model are reused across calls with the same n_topics.
         """
-        vectorizer = CountVectorizer(stop_words='english', max_df=0.9, min_df=2)
-        dtm = vectorizer.fit_transform(self.news_data['clean_headline'])
+        if self._vectorizer is None:
+            self._vectorizer = CountVectorizer(stop_words='english', max_df=0.9, min_df=2, dtype=np.float32)
+            self._dtm = self._vectorizer.fit_transform(self.news_data['clean_headline'])
+        dtm = self._dtm
 
-        lda = LatentDirichletAllocation(n_components=n_topics, random_state=42)
-        lda.fit(dtm)
+        if self._lda is None or self._lda.n_components != n_topics:
+            self._lda = LatentDirichletAllocation(n_components=n_topics, learning_method='online',
+                                                  batch_size=1024, n_jobs=-1, random_state=42)
+            self._lda.fit(dtm)
+        lda = self._lda
 
-        feature_names = vectorizer.get_feature_names_out()
+        feature_names = self._vectorizer.get_feature_names_out()
         for idx, topic in enumerate(lda.components_):
             print(f"\nTopic {idx+1}:")
             print([feature_names[i] for i in topic.argsort()[-n_top_words:]])
@@ -143,17 +396,11 @@ class FinancialNewsEDA:
         self.news_data['dominant_topic'] = topic_values.argmax(axis=1)
         return self.news_data
 
-    def sentiment_analysis(self):
+    def sentiment_analysis(self, method='lexicon'):
         """
-        Perform sentiment analysis on headlines using TextBlob.
+        Perform sentiment analysis on headlines using the TextBlob lexicon or VADER.
         """
-        def get_sentiment(text):
-            if pd.isna(text):
-                return 0  # neutral for empty headlines
-            blob = TextBlob(text)
-            return blob.sentiment.polarity
-
-        self.news_data['sentiment'] = self.news_data['headline'].apply(get_sentiment)
+        apply_sentiment(self.news_data, 'headline', method=method)
         print("\nSample of Sentiment Scores:")
         print(self.news_data[['headline', 'sentiment']].head())
         return self.news_data
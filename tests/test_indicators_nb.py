@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+
+from src.indicators_nb import compute_all
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+
+@unittest.skipIf(talib is None, "TA-Lib is not installed")
+class TestComputeAllMatchesTalib(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 500)))
+        self.out = compute_all(self.close)
+
+    def assert_matches(self, column, expected):
+        actual = self.out[:, column]
+        np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-9, equal_nan=True)
+
+    def test_sma(self):
+        self.assert_matches(0, talib.SMA(self.close, timeperiod=20))
+        self.assert_matches(1, talib.SMA(self.close, timeperiod=50))
+
+    def test_rsi(self):
+        self.assert_matches(2, talib.RSI(self.close, timeperiod=14))
+
+    def test_macd(self):
+        macd, macd_signal, macd_hist = talib.MACD(self.close)
+        self.assert_matches(3, macd)
+        self.assert_matches(4, macd_signal)
+        self.assert_matches(5, macd_hist)
+
+
+if __name__ == '__main__':
+    unittest.main()
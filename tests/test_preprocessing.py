@@ -0,0 +1,69 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from scripts.preprocessing import align_dates, load_data
+from src.sentiment_analysis import FinancialNewsEDA
+
+
+STOCK_CSV = (
+    "date,open,high,low,close,volume\n"
+    "2020-06-04,10.0,11.0,9.5,10.5,1000\n"
+    "2020-06-05,10.5,11.5,10.0,11.0,2000\n"
+)
+
+
+class TestLoadDataDates(unittest.TestCase):
+    def load(self, news_dates):
+        news_csv = "headline,publisher,date\n" + "".join(
+            f"Headline {i},Publisher,{date}\n" for i, date in enumerate(news_dates))
+        with tempfile.TemporaryDirectory() as tmp:
+            news_path = os.path.join(tmp, 'news.csv')
+            stock_path = os.path.join(tmp, 'stock.csv')
+            with open(news_path, 'w') as f:
+                f.write(news_csv)
+            with open(stock_path, 'w') as f:
+                f.write(STOCK_CSV)
+            return load_data(news_path, stock_path)
+
+    def converted(self, news_df):
+        eda = FinancialNewsEDA(news_df.copy())
+        with contextlib.redirect_stdout(io.StringIO()):
+            eda.convert_dates()
+        return eda.news_data
+
+    def assert_utc(self, news_dates, expected):
+        news_df, _ = self.load(news_dates)
+        self.assertEqual(list(self.converted(news_df)['date']),
+                         [pd.Timestamp(ts, tz='UTC') for ts in expected])
+
+    def assert_aligned(self, news_dates, expected):
+        news_df, stock_df = self.load(news_dates)
+        news_df, stock_df = align_dates(news_df, stock_df)
+        self.assertEqual(news_df['date'].dtype, 'datetime64[ns]')
+        self.assertEqual(sorted(news_df['date']), [pd.Timestamp(day) for day in expected])
+        self.assertEqual(list(stock_df['date']), [pd.Timestamp('2020-06-04'), pd.Timestamp('2020-06-05')])
+
+    def test_offset_dates(self):
+        dates = ['2020-06-05 21:30:54-04:00', '2020-06-05 10:00:00-04:00']
+        self.assert_utc(dates, ['2020-06-06 01:30:54', '2020-06-05 14:00:00'])
+        self.assert_aligned(dates, ['2020-06-05', '2020-06-05'])
+
+    def test_naive_dates_are_exchange_local(self):
+        dates = ['2020-06-05 21:30:54', '2020-01-10 09:30:00']
+        self.assert_utc(dates, ['2020-06-06 01:30:54', '2020-01-10 14:30:00'])
+        self.assert_aligned(dates, ['2020-01-10', '2020-06-05'])
+
+    def test_mixed_dates(self):
+        dates = ['2020-06-05 21:30:54-04:00', '2020-06-05 21:30:54', '2020-06-06T02:00:00Z', '2020-06-04']
+        self.assert_utc(dates, ['2020-06-06 01:30:54', '2020-06-06 01:30:54',
+                                '2020-06-06 02:00:00', '2020-06-04 04:00:00'])
+        self.assert_aligned(dates, ['2020-06-04', '2020-06-05', '2020-06-05', '2020-06-05'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.indicators_nb import compute_all
+from src.quantitative_analysis import StockAnalysis
+
+
+def make_prices(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 150 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=n, freq='B'),
+        'Open': close * (1 + rng.normal(0, 0.005, n)),
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close': close,
+        'Volume': rng.integers(10_000_000, 200_000_000, n),
+    })
+
+
+class TestStockAnalysisFloat32(unittest.TestCase):
+    def setUp(self):
+        self.prices = make_prices()
+        self.analysis = StockAnalysis('TEST', df=self.prices)
+
+    def test_ohlc_stored_as_float32(self):
+        for column in ['open', 'high', 'low', 'close']:
+            self.assertEqual(self.analysis.df[column].dtype, np.float32)
+
+    def test_volume_unchanged(self):
+        np.testing.assert_array_equal(self.analysis.df['volume'].to_numpy(), self.prices['Volume'].to_numpy())
+
+    def test_float32_sma_close_to_float64(self):
+        self.analysis.add_technical_indicators()
+        close64 = self.prices['Close'].to_numpy(dtype=np.float64)
+        expected = compute_all(close64)
+        for column, name in [(0, 'MA_20'), (1, 'MA_50')]:
+            with self.subTest(indicator=name):
+                actual = self.analysis.df[name].to_numpy(dtype=np.float64)
+                valid = ~np.isnan(expected[:, column])
+                np.testing.assert_array_equal(np.isnan(actual), ~valid)
+                error = np.abs(actual[valid] - expected[valid, column])
+                self.assertTrue(np.all(error < 1e-3 * close64[valid]))
+
+    def test_input_frame_not_modified(self):
+        original = make_prices()
+        self.analysis.add_technical_indicators()
+        pd.testing.assert_frame_equal(self.prices, original)
+
+
+if __name__ == '__main__':
+    unittest.main()
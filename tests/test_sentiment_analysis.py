@@ -0,0 +1,59 @@
+import contextlib
+import io
+import unittest
+
+import matplotlib
+import pandas as pd
+from textblob import TextBlob
+
+from src.sentiment_analysis import FinancialNewsEDA, score_headlines
+
+
+HEADLINES = [
+    "Stocks rally on strong earnings",
+    "Shares fall 5% after weak guidance",
+    "Apple is not very happy",
+    "very good news",
+    "Not a good day for Tesla",
+    "Really not good results",
+    "Market isn't great",
+    "Terribly bad quarter!!",
+    "Amazon's profits rise sharply",
+    "Why Apple's (AAPL) outlook is extremely positive",
+    "no good, very very poor",
+    "never bad",
+    "Analysts are not at all optimistic...",
+    "Nvidia posts record revenue!",
+    "Fed holds rates steady",
+]
+
+
+class TestScoreHeadlines(unittest.TestCase):
+    def test_matches_textblob_polarity(self):
+        scores = score_headlines(HEADLINES)
+        for headline, score in zip(HEADLINES, scores):
+            with self.subTest(headline=headline):
+                self.assertAlmostEqual(score, TextBlob(headline).sentiment.polarity, places=9)
+
+    def test_missing_and_empty_headlines_are_neutral(self):
+        self.assertEqual(list(score_headlines([None, "", "the of and"])), [0.0, 0.0, 0.0])
+
+
+class TestHeadlineLengthStats(unittest.TestCase):
+    def test_missing_headlines_are_not_counted_as_zero(self):
+        matplotlib.use('Agg')
+        eda = FinancialNewsEDA(pd.DataFrame({
+            'headline': ['abc', None, 'abcdefg'],
+            'publisher': ['A', 'B', 'C'],
+            'date': ['2020-06-05'] * 3,
+        }))
+        with contextlib.redirect_stdout(io.StringIO()):
+            eda.headline_length_stats()
+        lengths = eda.news_data['headline_length']
+        self.assertEqual(lengths.isna().tolist(), [False, True, False])
+        self.assertEqual(lengths.min(), 3)
+        self.assertEqual(lengths.mean(), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()